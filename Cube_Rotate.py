@@ -2,18 +2,38 @@
 3D Space Animation with Rotating Cube and Star Field
 
 This script creates a space-like animation featuring a rotating 3D cube
-and star particles that create a starfield effect using Python's turtle module.
+and star particles that create a starfield effect using Python's turtle module,
+or pygame when it is installed.
 """
 
 import turtle
 import math
-import random
 import time
+from collections import defaultdict
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional; without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+try:
+    import pygame
+except ImportError:
+    pygame = None  # Optional; the turtle canvas backend is used without it
 
 # System Configuration
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 STAR_COUNT = 100
+PARALLEL_STAR_THRESHOLD = 1000  # Star counts from which step_stars runs multithreaded
 ROTATION_SPEED = 0.02  # Radians per frame
 STAR_SPEED = 7
 CUBE_SIZE = 150
@@ -24,68 +44,137 @@ FRAME_DURATION = 1.0 / TARGET_FPS
 BACKGROUND_COLOR = "black"
 CUBE_COLOR = "cyan"
 STAR_COLOR_BASE = (0.8, 0.8, 0.9)  # Base color for stars (RGB)
+BRIGHTNESS_LEVELS = 32  # Brightness is quantized so colors can be looked up
 
 # Z-depth settings
 MIN_Z = 1  # Minimum Z value to prevent division by zero
 MAX_Z = SCREEN_WIDTH  # Maximum Z distance for stars
+INV_MAX_Z = 1.0 / MAX_Z  # Multiply by this instead of dividing by MAX_Z
 FOV = SCREEN_WIDTH * 0.8  # Field of view for projection
 
+# Drawing settings
+USE_PYGAME = True  # Render with pygame when it is installed
+LINE_WIDTH = 2
+REDRAW_THRESHOLD = 1.0  # Pixels a canvas item must change by before it is moved
+STAR_MARGIN = 50  # Extra margin to allow stars just outside the visible area
+HALF_W = SCREEN_WIDTH / 2 + STAR_MARGIN  # Star clip rectangle half extents
+HALF_H = SCREEN_HEIGHT / 2 + STAR_MARGIN
+HALF_W_SQ = HALF_W * HALF_W  # Squared so the clip test needs no abs()
+HALF_H_SQ = HALF_H * HALF_H
+
+
+def rgb_to_hex(r, g, b):
+    """Convert an RGB color with 0-1 components to a Tk hex color string."""
+    return "#%02x%02x%02x" % (int(r * 255), int(g * 255), int(b * 255))
+
+
+def rgb_to_ints(r, g, b):
+    """Convert an RGB color with 0-1 components to a 0-255 integer tuple."""
+    return int(r * 255), int(g * 255), int(b * 255)
+
+
+def bucket_level(bucket):
+    """Return the brightness level (0-1) of a quantized brightness bucket."""
+    return bucket / (BRIGHTNESS_LEVELS - 1)
+
+
+def edge_color(level):
+    """Return the RGB color of a cube edge at the given brightness."""
+    return level, level, 1  # Blue-cyan effect
+
 
-class StarParticle:
-    """Represents a star particle in 3D space that moves toward the viewer."""
+def star_color(level):
+    """Return the RGB color of a star at the given brightness."""
+    return level, STAR_COLOR_BASE[1] * level, STAR_COLOR_BASE[2]
+
+
+# RGB color of every brightness bucket, converted once per backend
+EDGE_COLOR_LUT = [edge_color(bucket_level(b)) for b in range(BRIGHTNESS_LEVELS)]
+STAR_COLOR_LUT = [star_color(bucket_level(b)) for b in range(BRIGHTNESS_LEVELS)]
+
+
+# Explicit signatures compile the kernels at import for C-contiguous arrays
+@njit("void(f4[::1], f4[::1], f4[::1], f4[::1], f4[::1], "
+      "f4[::1], f4[::1], f4[::1], i4[::1], b1[::1])",
+      cache=True, fastmath=True, parallel=STAR_COUNT >= PARALLEL_STAR_THRESHOLD)
+def step_stars(x, y, z, speed, size, out_px, out_py, out_size, out_bucket, out_visible):
+    """Move, project, cull and shade all stars in a single pass.
     
-    def __init__(self):
-        """Initialize a star particle with random properties."""
-        self.reset()
+    Stars that pass the viewer are marked not visible until the caller
+    resets them. Size and brightness bucket are only written for visible stars.
+    Every star is independent, so large star fields split the loop across cores.
+    """
+    for i in prange(z.shape[0]):
+        z[i] -= STAR_SPEED * speed[i]
+        if z[i] < MIN_Z:
+            out_visible[i] = False
+            continue
         
-    def reset(self):
-        """Reset star to a new random position and properties."""
-        self.z = random.randint(MIN_Z + 9, MAX_Z)  # Start deeper in space
-        self.x = random.randint(-SCREEN_WIDTH//2, SCREEN_WIDTH//2)
-        self.y = random.randint(-SCREEN_HEIGHT//2, SCREEN_HEIGHT//2)
-        self.speed = random.uniform(0.5, 2.0)
-        self.size = random.uniform(1, 3)
+        # Project to 2D screen coordinates
+        scale = 100.0 / z[i]
+        px = x[i] * scale
+        py = y[i] * scale
+        out_px[i] = px
+        out_py[i] = py
         
-    def update(self):
-        """Update star position by moving it closer to the viewer."""
-        self.z -= STAR_SPEED * self.speed
-        if self.z < MIN_Z:
-            self.reset()
-            
-    def get_projected_position(self):
-        """Calculate the 2D screen position of the star."""
-        if self.z < MIN_Z:
-            return None  # Skip stars that are too close
-            
-        scale = 100 / self.z
-        x = self.x * scale
-        y = self.y * scale
-        return x, y
-        
-    def get_color(self):
-        """Calculate star color based on distance (further stars are dimmer)."""
-        # Map z from MIN_Z-MAX_Z to brightness level 1.0-0.0
-        brightness = max(0.0, min(1.0, 1.0 - (self.z / MAX_Z)))
-        return (
-            brightness, 
-            STAR_COLOR_BASE[1] * brightness, 
-            STAR_COLOR_BASE[2]
-        )
-        
-    def get_size(self):
-        """Calculate star size based on distance (further stars are smaller)."""
-        size = self.size * (1 - self.z / MAX_Z)
-        return max(0.1, size)  # Ensure minimum size
+        # Check if star is within visible screen bounds (with margin)
+        out_visible[i] = (px * px <= HALF_W_SQ) & (py * py <= HALF_H_SQ)
+        if not out_visible[i]:
+            continue
+        
+        # Further stars are dimmer and smaller
+        depth = 1.0 - z[i] * INV_MAX_Z
+        out_bucket[i] = int(min(1.0, max(0.0, depth)) * (BRIGHTNESS_LEVELS - 1))
+        out_size[i] = max(0.1, size[i] * depth)
+
+
+@njit("void(f4[:, ::1], f4[:, ::1], f4[::1], f4[::1], f4[::1])", cache=True, fastmath=True)
+def transform_cube(vertices, rotation, out_px, out_py, out_z):
+    """Rotate cube vertices by a 3x3 rotation matrix and project them to 2D."""
+    for i in range(vertices.shape[0]):
+        x, y, z = vertices[i, 0], vertices[i, 1], vertices[i, 2]
+        rx = rotation[0, 0] * x + rotation[0, 1] * y + rotation[0, 2] * z
+        ry = rotation[1, 0] * x + rotation[1, 1] * y + rotation[1, 2] * z
+        rz = rotation[2, 0] * x + rotation[2, 1] * y + rotation[2, 2] * z
+        
+        # Perspective projection
+        z_adjusted = max(rz, -FOV + 1)  # Prevent division by zero
+        scale = FOV / (FOV + z_adjusted)
+        out_px[i] = rx * scale
+        out_py[i] = ry * scale
+        out_z[i] = rz
+
+
+def compose_rotation(ax, ay, az):
+    """Build the rotation matrix for an X, then Y, then Z axis rotation."""
+    cx, sx = math.cos(ax), math.sin(ax)
+    cy, sy = math.cos(ay), math.sin(ay)
+    cz, sz = math.cos(az), math.sin(az)
+    
+    rot_x = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+    rot_y = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    rot_z = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]])
+    return rot_z @ rot_y @ rot_x
+
+
+# The cube turns by the same amount every frame, so its per-frame rotation is fixed.
+# Cube math uses float32 throughout; the extra precision is lost at pixel scale anyway.
+DELTA_ROTATION = compose_rotation(
+    ROTATION_SPEED, ROTATION_SPEED * 0.7, ROTATION_SPEED * 0.3).astype(np.float32)
+REORTHONORMALIZE_INTERVAL = 1000  # Frames between rounding-error corrections
 
 
 class RotatingCube:
     """Represents a 3D cube that can rotate on all three axes."""
     
+    __slots__ = ("size", "vertices", "projected_x", "projected_y", "depth",
+                 "edges", "rotation", "frames_rotated")
+    
     def __init__(self, size):
         """Initialize a cube with the given size."""
         self.size = size
         # Define cube vertices (corners)
-        self.vertices = [
+        self.vertices = np.array([
             (-size, -size, -size),  # 0: front bottom left
             (size, -size, -size),   # 1: front bottom right
             (size, size, -size),    # 2: front top right
@@ -94,101 +183,247 @@ class RotatingCube:
             (size, -size, size),    # 5: back bottom right
             (size, size, size),     # 6: back top right
             (-size, size, size)     # 7: back top left
-        ]
+        ], dtype=np.float32)
+        # Output buffers for the projected vertices
+        self.projected_x = np.zeros(len(self.vertices), dtype=np.float32)
+        self.projected_y = np.zeros(len(self.vertices), dtype=np.float32)
+        self.depth = np.zeros(len(self.vertices), dtype=np.float32)
         # Define cube edges
-        self.edges = [
+        self.edges = np.array([
             (0, 1), (1, 2), (2, 3), (3, 0),  # front face
             (4, 5), (5, 6), (6, 7), (7, 4),  # back face
             (0, 4), (1, 5), (2, 6), (3, 7)   # connecting edges
-        ]
-        self.angle_x = 0
-        self.angle_y = 0
-        self.angle_z = 0
+        ], dtype=np.int8)
+        # Accumulated rotation, advanced by DELTA_ROTATION every frame
+        self.rotation = np.eye(3, dtype=np.float32)
+        self.frames_rotated = 0
         
     def rotate(self):
-        """Update rotation angles for all three axes."""
-        self.angle_x += ROTATION_SPEED
-        self.angle_y += ROTATION_SPEED * 0.7
-        self.angle_z += ROTATION_SPEED * 0.3
-        
-    def _apply_rotation(self, x, y, z):
-        """Apply 3D rotation to a point."""
-        # X-axis rotation
-        y, z = (
-            y * math.cos(self.angle_x) - z * math.sin(self.angle_x),
-            y * math.sin(self.angle_x) + z * math.cos(self.angle_x)
-        )
-        # Y-axis rotation
-        x, z = (
-            x * math.cos(self.angle_y) + z * math.sin(self.angle_y),
-            -x * math.sin(self.angle_y) + z * math.cos(self.angle_y)
-        )
-        # Z-axis rotation
-        x, y = (
-            x * math.cos(self.angle_z) - y * math.sin(self.angle_z),
-            x * math.sin(self.angle_z) + y * math.cos(self.angle_z)
-        )
-        return x, y, z
-        
-    def _project_3d_to_2d(self, x, y, z):
-        """Project 3D coordinates to 2D screen coordinates."""
-        # Orthographic projection with perspective
-        z_adjusted = max(z, -FOV + 1)  # Prevent division by zero
-        scale = FOV / (FOV + z_adjusted)
-        return x * scale, y * scale
+        """Advance the rotation by one frame's rotation on all three axes."""
+        self.rotation = self.rotation @ DELTA_ROTATION
+        self.frames_rotated += 1
+        
+        # Snap back to the nearest pure rotation to prevent drift
+        if self.frames_rotated % REORTHONORMALIZE_INTERVAL == 0:
+            u, _, vt = np.linalg.svd(self.rotation)
+            self.rotation = u @ vt
         
     def get_projected_vertices(self):
-        """Calculate all projected vertices after rotation."""
-        projected_vertices = []
-        rotated_vertices = []  # Store the rotated 3D vertices for depth calculation
-        
-        for x, y, z in self.vertices:
-            # Apply rotation
-            rx, ry, rz = self._apply_rotation(x, y, z)
-            rotated_vertices.append((rx, ry, rz))
-            
-            # Project to 2D
-            px, py = self._project_3d_to_2d(rx, ry, rz)
-            projected_vertices.append((px, py))
+        """Calculate all projected vertices and their depth after rotation."""
+        transform_cube(self.vertices, self.rotation,
+                       self.projected_x, self.projected_y, self.depth)
+        return self.projected_x, self.projected_y, self.depth
+        
+    def draw(self, backend):
+        """Draw the cube using the provided rendering backend."""
+        # Get projected vertices and rotated depth
+        px, py, depth = self.get_projected_vertices()
+        
+        # Gather the endpoints of every edge at once
+        start, end = self.edges[:, 0], self.edges[:, 1]
+        segments = np.stack([px[start], py[start], px[end], py[end]], axis=1)
+        
+        # Calculate average Z depth of each edge
+        avg_z = 0.5 * (depth[start] + depth[end])
+        
+        # Calculate color intensity based on Z depth
+        # Edges further back (more positive Z) are dimmer
+        max_z = self.size * 1.5
+        min_z = -max_z
+        z_range = max_z - min_z
+        
+        # Map z from min_z-max_z to brightness level 1.0-0.3
+        brightness = np.clip(1.0 - 0.7 * ((avg_z - min_z) / z_range), 0.3, 1.0)
+        buckets = (brightness * (BRIGHTNESS_LEVELS - 1)).astype(np.int32)
+        
+        backend.draw_edges(segments, buckets)
+
+
+class CanvasBackend:
+    """Draws on the Tk canvas of a turtle screen, reusing items across frames."""
+    
+    def __init__(self, on_close):
+        """Set up the turtle screen and register the window close handler."""
+        self.screen = turtle.Screen()
+        self.screen.setup(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.screen.bgcolor(BACKGROUND_COLOR)
+        self.screen.title("3D Space Animation")
+        self.screen.tracer(0)  # Turn off animation updates for manual control
+        
+        self.canvas = self.screen.getcanvas()
+        self.star_ids = []
+        self.edge_ids = []
+        
+        # What each item currently shows, so unchanged items are left alone
+        self.star_shown = np.zeros(0, dtype=bool)
+        self.star_shape = np.zeros((0, 3), dtype=np.float32)  # x, y, size
+        self.star_buckets = np.zeros(0, dtype=np.int32)
+        self.edge_segments = np.zeros((0, 4), dtype=np.float32)
+        self.edge_buckets = np.zeros(0, dtype=np.int32)
+        
+        # Tk color strings per brightness bucket
+        self.edge_colors = [rgb_to_hex(*color) for color in EDGE_COLOR_LUT]
+        self.star_colors = [rgb_to_hex(*color) for color in STAR_COLOR_LUT]
+        
+        self.screen._root.protocol("WM_DELETE_WINDOW", on_close)
+        
+    def create_items(self, star_count, edge_count):
+        """Create the reusable star and edge items."""
+        self.star_ids = [self.canvas.create_oval(0, 0, 0, 0, outline="", state="hidden")
+                         for _ in range(star_count)]
+        self.star_shown = np.zeros(star_count, dtype=bool)
+        self.star_shape = np.zeros((star_count, 3), dtype=np.float32)
+        self.star_buckets = np.full(star_count, -1, dtype=np.int32)
+        
+        # Created last so the cube stays on top
+        self.edge_ids = [self.canvas.create_line(0, 0, 0, 0, width=LINE_WIDTH)
+                         for _ in range(edge_count)]
+        self.edge_segments = np.zeros((edge_count, 4), dtype=np.float32)
+        self.edge_buckets = np.full(edge_count, -1, dtype=np.int32)
+        
+    def begin_frame(self):
+        """Start a new frame (items are updated in place, so nothing is cleared)."""
+        
+    def draw_stars(self, indices, px, py, sizes, buckets):
+        """Move the visible stars' dots and hide the rest."""
+        star_ids = self.star_ids
+        coords, itemconfig = self.canvas.coords, self.canvas.itemconfig
+        
+        # Hide stars that left the screen since the last frame
+        visible = np.zeros(len(star_ids), dtype=bool)
+        visible[indices] = True
+        for i in np.nonzero(self.star_shown & ~visible)[0]:
+            itemconfig(star_ids[i], state="hidden")
+        newly_shown = ~self.star_shown[indices]
+        self.star_shown = visible
+        
+        # Only move dots that shifted or grew by at least the threshold
+        shape = np.stack([px, py, sizes], axis=1)
+        change = np.abs(shape - self.star_shape[indices]).sum(axis=1)
+        moved = newly_shown | (change > REDRAW_THRESHOLD)
+        moved_indices = indices[moved]
+        self.star_shape[moved_indices] = shape[moved]
+        for i, (x, y, size) in zip(moved_indices.tolist(), shape[moved].tolist()):
+            y = -y  # Canvas Y axis points down
+            radius = size / 2
+            coords(star_ids[i], x - radius, y - radius, x + radius, y + radius)
             
-        return projected_vertices, rotated_vertices
-        
-    def draw(self, turtle_obj):
-        """Draw the cube using the provided turtle object."""
-        # Get projected vertices and rotated 3D vertices
-        projected_vertices, rotated_vertices = self.get_projected_vertices()
-        
-        # Draw cube edges with depth-based coloring
-        for edge in self.edges:
-            # Get the vertices for this edge
-            v1, v2 = edge
-            x1, y1 = projected_vertices[v1]
-            x2, y2 = projected_vertices[v2]
+        # Only recolor stars whose brightness level changed, one color per level
+        recolor = newly_shown | (buckets != self.star_buckets[indices])
+        recolor_indices, recolor_buckets = indices[recolor], buckets[recolor]
+        self.star_buckets[recolor_indices] = recolor_buckets
+        for bucket in np.unique(recolor_buckets).tolist():
+            color = self.star_colors[bucket]
+            for i in recolor_indices[recolor_buckets == bucket].tolist():
+                itemconfig(star_ids[i], fill=color, state="normal")
+                
+    def draw_edges(self, segments, buckets):
+        """Move the cube's edge lines and set their colors."""
+        edge_ids = self.edge_ids
+        coords, itemconfig = self.canvas.coords, self.canvas.itemconfig
+        
+        # Only move edges whose endpoints shifted by at least the threshold
+        moved = np.abs(segments - self.edge_segments).sum(axis=1) > REDRAW_THRESHOLD
+        self.edge_segments[moved] = segments[moved]
+        for i, (x1, y1, x2, y2) in zip(np.flatnonzero(moved).tolist(), segments[moved].tolist()):
+            coords(edge_ids[i], x1, -y1, x2, -y2)  # Canvas Y axis points down
             
-            # Calculate average Z depth of this edge
-            z1 = rotated_vertices[v1][2]
-            z2 = rotated_vertices[v2][2]
-            avg_z = (z1 + z2) / 2
+        # Only recolor edges whose brightness level changed, grouped by level
+        grouped = defaultdict(list)
+        for i in np.flatnonzero(buckets != self.edge_buckets).tolist():
+            grouped[int(buckets[i])].append(edge_ids[i])
+        self.edge_buckets[:] = buckets
+        
+        # Set edge colors based on depth, one color per brightness level
+        for bucket, ids in grouped.items():
+            color = self.edge_colors[bucket]
+            for edge_id in ids:
+                itemconfig(edge_id, fill=color)
+                
+    def present(self):
+        """Show the finished frame."""
+        self.screen.update()
+        
+    def schedule(self, callback, delay_ms):
+        """Call callback once after delay_ms milliseconds."""
+        self.screen.ontimer(callback, delay_ms)
+        
+    def mainloop(self):
+        """Run Tk's event loop until the window is closed."""
+        self.screen.mainloop()
+        
+    def close(self):
+        """Close the window and leave the event loop."""
+        self.screen.bye()
+
+
+class PygameBackend:
+    """Draws with pygame, redrawing the whole frame each time."""
+    
+    def __init__(self, on_close):
+        """Open the pygame window."""
+        pygame.init()
+        self.surface = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("3D Space Animation")
+        self.on_close = on_close
+        self.pending = None  # (callback, delay_ms) of the next scheduled call
+        
+        # pygame colors per brightness bucket
+        self.edge_colors = [rgb_to_ints(*color) for color in EDGE_COLOR_LUT]
+        self.star_colors = [rgb_to_ints(*color) for color in STAR_COLOR_LUT]
+        
+        # Screen coordinates have their origin at the top-left corner
+        self.center_x = SCREEN_WIDTH // 2
+        self.center_y = SCREEN_HEIGHT // 2
+        
+    def create_items(self, star_count, edge_count):
+        """Nothing is retained between frames, so there is nothing to create."""
+        
+    def begin_frame(self):
+        """Start a new frame by clearing the window."""
+        self.surface.fill(BACKGROUND_COLOR)
+        
+    def draw_stars(self, indices, px, py, sizes, buckets):
+        """Draw the visible stars as filled circles."""
+        colors = self.star_colors
+        circle, surface = pygame.draw.circle, self.surface
+        cx, cy = self.center_x, self.center_y
+        for x, y, size, bucket in zip(px.tolist(), py.tolist(), sizes.tolist(),
+                                      buckets.tolist()):
+            circle(surface, colors[bucket], (cx + x, cy - y), max(1.0, size / 2))
             
-            # Calculate color intensity based on Z depth
-            # Edges further back (more positive Z) are dimmer
-            max_z = self.size * 1.5
-            min_z = -max_z
-            z_range = max_z - min_z
+    def draw_edges(self, segments, buckets):
+        """Draw the cube's edges as lines."""
+        line, surface = pygame.draw.line, self.surface
+        colors = self.edge_colors
+        cx, cy = self.center_x, self.center_y
+        for (x1, y1, x2, y2), bucket in zip(segments.tolist(), buckets.tolist()):
+            line(surface, colors[bucket], (cx + x1, cy - y1), (cx + x2, cy - y2), LINE_WIDTH)
             
-            # Map z from min_z-max_z to brightness level 1.0-0.3
-            brightness = 1.0 - 0.7 * ((avg_z - min_z) / z_range)
-            brightness = max(0.3, min(1.0, brightness))
+    def present(self):
+        """Show the finished frame."""
+        pygame.display.flip()
+        
+    def schedule(self, callback, delay_ms):
+        """Call callback once after delay_ms milliseconds."""
+        self.pending = (callback, delay_ms)
+        
+    def mainloop(self):
+        """Run scheduled callbacks and handle window events until closed."""
+        while self.pending is not None:
+            callback, delay_ms = self.pending
+            self.pending = None
+            pygame.time.wait(delay_ms)
             
-            # Set edge color based on depth
-            turtle_obj.pencolor(brightness, brightness, 1)  # Blue-cyan effect
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.on_close()
+            callback()
             
-            # Draw the edge
-            turtle_obj.penup()
-            turtle_obj.goto(x1, y1)
-            turtle_obj.pendown()
-            turtle_obj.goto(x2, y2)
-            turtle_obj.penup()
+    def close(self):
+        """Close the window and leave the event loop."""
+        self.pending = None
+        pygame.quit()
 
 
 class SpaceAnimation:
@@ -196,71 +431,73 @@ class SpaceAnimation:
     
     def __init__(self):
         """Initialize the animation environment."""
-        # Set up screen
-        self.screen = turtle.Screen()
-        self.screen.setup(SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.screen.bgcolor(BACKGROUND_COLOR)
-        self.screen.title("3D Space Animation")
-        self.screen.tracer(0)  # Turn off animation updates for manual control
+        # Set up the rendering backend
+        if USE_PYGAME and pygame is not None:
+            self.backend = PygameBackend(self.close)
+        else:
+            self.backend = CanvasBackend(self.close)
         
         # Create objects
         self.cube = RotatingCube(CUBE_SIZE)
-        self.stars = [StarParticle() for _ in range(STAR_COUNT)]
         
-        # Set up drawing turtles
-        self.cube_turtle = turtle.Turtle()
-        self.star_turtle = turtle.Turtle()
+        # Star field stored as parallel arrays (one entry per star)
+        self.rng = np.random.default_rng()
+        self.star_x = np.zeros(STAR_COUNT, dtype=np.float32)
+        self.star_y = np.zeros(STAR_COUNT, dtype=np.float32)
+        self.star_z = np.zeros(STAR_COUNT, dtype=np.float32)
+        self.star_speed = np.zeros(STAR_COUNT, dtype=np.float32)
+        self.star_size = np.zeros(STAR_COUNT, dtype=np.float32)
         
-        # Configure turtles
-        for t in [self.cube_turtle, self.star_turtle]:
-            t.hideturtle()
-            t.pensize(2)
-            t.speed(0)  # Fastest drawing speed
+        # Projected star positions, appearance and visibility, filled in by step_stars
+        self.star_px = np.zeros(STAR_COUNT, dtype=np.float32)
+        self.star_py = np.zeros(STAR_COUNT, dtype=np.float32)
+        self.star_draw_size = np.zeros(STAR_COUNT, dtype=np.float32)
+        self.star_bucket = np.zeros(STAR_COUNT, dtype=np.int32)
+        self.star_visible = np.zeros(STAR_COUNT, dtype=bool)
+        self.reset_stars(np.ones(STAR_COUNT, dtype=bool))
+        
+        self.backend.create_items(STAR_COUNT, len(self.cube.edges))
         
         # Animation state
         self.running = True
-        self.last_frame_time = time.time()
+        self.last_frame_time = time.perf_counter()
         self.frame_count = 0
-        self.start_time = time.time()
-        
-        # Register window close handler
-        self.screen._root.protocol("WM_DELETE_WINDOW", self.close)
+        self.start_time = time.perf_counter()
         
     def close(self):
         """Handle window close event."""
         self.running = False
         
+    def reset_stars(self, mask):
+        """Reset the masked stars to new random positions and properties."""
+        count = int(mask.sum())
+        if count == 0:
+            return
+        rng = self.rng
+        self.star_z[mask] = rng.integers(MIN_Z + 9, MAX_Z, count, endpoint=True)  # Start deeper in space
+        self.star_x[mask] = rng.integers(-SCREEN_WIDTH//2, SCREEN_WIDTH//2, count, endpoint=True)
+        self.star_y[mask] = rng.integers(-SCREEN_HEIGHT//2, SCREEN_HEIGHT//2, count, endpoint=True)
+        self.star_speed[mask] = rng.uniform(0.5, 2.0, count)
+        self.star_size[mask] = rng.uniform(1, 3, count)
+        
     def draw_stars(self):
-        """Draw all star particles."""
-        self.star_turtle.clear()
-        for star in self.stars:
-            # Get projected position
-            position = star.get_projected_position()
-            if position is None:
-                continue
-                
-            x, y = position
-            
-            # Check if star is within visible screen bounds (with margin)
-            margin = 50  # Extra margin to allow stars just outside the visible area
-            if (abs(x) > SCREEN_WIDTH/2 + margin or 
-                abs(y) > SCREEN_HEIGHT/2 + margin):
-                continue
-            
-            # Set color and position
-            self.star_turtle.color(*star.get_color())
-            self.star_turtle.penup()
-            self.star_turtle.goto(x, y)
-            
-            # Draw star as a dot
-            self.star_turtle.dot(star.get_size())
+        """Move all star particles and draw the visible ones."""
+        # Advance, project and shade every star in one pass over the arrays
+        step_stars(self.star_x, self.star_y, self.star_z, self.star_speed, self.star_size,
+                   self.star_px, self.star_py, self.star_draw_size, self.star_bucket,
+                   self.star_visible)
+        
+        indices = np.flatnonzero(self.star_visible)
+        self.backend.draw_stars(indices, self.star_px[indices], self.star_py[indices],
+                                self.star_draw_size[indices], self.star_bucket[indices])
+        
+        # Recycle stars that passed the viewer
+        self.reset_stars(self.star_z < MIN_Z)
             
     def update(self):
         """Update the animation state for one frame."""
-        # Update star positions
-        for star in self.stars:
-            star.update()
-            
+        # Stars are advanced while drawing them (see draw_stars)
+        
         # Update cube rotation
         self.cube.rotate()
         
@@ -269,38 +506,38 @@ class SpaceAnimation:
         
     def render(self):
         """Render the current frame."""
-        # Clear previous frame
-        self.cube_turtle.clear()
-        self.star_turtle.clear()
+        self.backend.begin_frame()
         
         # Draw all elements
         self.draw_stars()
-        self.cube.draw(self.cube_turtle)
+        self.cube.draw(self.backend)
         
         # Update the screen
-        self.screen.update()
+        self.backend.present()
+        
+    def tick(self):
+        """Update and render one frame, then schedule the next one."""
+        if not self.running:
+            self.backend.close()  # Leaves the main loop
+            return
+            
+        self.last_frame_time = time.perf_counter()
+        
+        # Update and render animation
+        self.update()
+        self.render()
+        
+        # Schedule the next frame, accounting for the time this one took
+        elapsed = time.perf_counter() - self.last_frame_time
+        delay_ms = max(1, int((FRAME_DURATION - elapsed) * 1000))
+        self.backend.schedule(self.tick, delay_ms)
         
     def run(self):
-        """Run the main animation loop."""
+        """Run the animation on the backend's event loop."""
         try:
-            while self.running:
-                # Calculate time elapsed since last frame
-                current_time = time.time()
-                elapsed = current_time - self.last_frame_time
-                
-                # Only render if enough time has passed for next frame
-                if elapsed >= FRAME_DURATION:
-                    # Calculate actual sleep time to maintain consistent frame rate
-                    self.last_frame_time = current_time
-                    
-                    # Update and render animation
-                    self.update()
-                    self.render()
-                else:
-                    # Sleep to prevent CPU hogging, but not too long to maintain frame rate
-                    sleep_time = max(0.001, FRAME_DURATION - elapsed - 0.002)
-                    time.sleep(sleep_time)
-                    
+            self.tick()
+            self.backend.mainloop()
+            
         except turtle.Terminator:
             # Handle case when window is closed suddenly
             print("Animation terminated.")
@@ -313,14 +550,14 @@ class SpaceAnimation:
         finally:
             # Safe cleanup
             try:
-                turtle.bye()
+                self.backend.close()
             except:
                 pass  # If window is already destroyed, ignore errors
 
 
 # Main entry point
 if __name__ == "__main__":
-    # Note: The turtle module is not ideal for high-performance graphics.
-    # For more complex 3D scenes, consider using PyGame, Panda3D, or other libraries.
+    # Note: The turtle module is not ideal for high-performance graphics, so pygame
+    # is used when installed. For more complex 3D scenes, consider Panda3D or similar.
     animation = SpaceAnimation()
     animation.run()
\ No newline at end of file
@@ -1,8 +1,28 @@
 import turtle
 import math
-import random
 import time
-from typing import List, Tuple
+from collections import namedtuple
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional; without it the kernels below run as plain Python
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import pygame
+except ImportError:
+    pygame = None  # Optional; the turtle backend is used without it
 
 # System Configuration
 class Config:
@@ -15,16 +35,27 @@ class Config:
     HUE_SPEED = 0.008
     FPS = 60
     FRAME_TIME = 1.0 / FPS
+    USE_PYGAME = True  # Render with pygame when it is installed
 
 # Color utilities
+# Precomputed colors for 1024 evenly spaced hues (saturation and value are fixed)
+_LUT = tuple(
+    (abs(math.sin(h * math.pi)) * 0.8 + 0.2,
+     abs(math.sin((h + 0.33) * math.pi)) * 0.8 + 0.2,
+     abs(math.sin((h + 0.67) * math.pi)) * 0.8 + 0.2)
+    for h in (i / 1024 for i in range(1024))
+)
+
+def _hsv_to_rgb(h: float, s: float = 1.0, v: float = 1.0) -> Tuple[float, float, float]:
+    """Convert HSV color to RGB color."""
+    return _LUT[int(h * 1024.0) & 1023]
+
 class ColorUtils:
-    @staticmethod
-    def hsv_to_rgb(h: float, s: float = 1.0, v: float = 1.0) -> Tuple[float, float, float]:
-        """Convert HSV color to RGB color."""
-        r = abs(math.sin(h * math.pi)) * 0.8 + 0.2
-        g = abs(math.sin((h + 0.33) * math.pi)) * 0.8 + 0.2
-        b = abs(math.sin((h + 0.67) * math.pi)) * 0.8 + 0.2
-        return (r, g, b)
+    _LUT = _LUT
+    hsv_to_rgb = staticmethod(_hsv_to_rgb)  # Kept for existing callers
+
+# Immutable 3D vector for positions and scales read every frame
+Vec3 = namedtuple('Vec3', 'x y z', defaults=(0.0, 0.0, 0.0))
 
 # Vector3D class for 3D math operations
 class Vector3D:
@@ -56,99 +87,228 @@ class Vector3D:
     
     def magnitude(self) -> float:
         """Calculate vector magnitude."""
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
+        x, y, z = self.x, self.y, self.z
+        return math.sqrt(x * x + y * y + z * z)
     
     def normalize(self) -> 'Vector3D':
         """Return normalized vector."""
         mag = self.magnitude()
         if mag > 0:
-            return Vector3D(self.x / mag, self.y / mag, self.z / mag)
+            inv = 1.0 / mag
+            return Vector3D(self.x * inv, self.y * inv, self.z * inv)
         return Vector3D()
 
+# Numeric kernels, JIT-compiled when Numba is installed
+@njit(cache=True, fastmath=True)
+def build_rotation_matrix(rx: float, ry: float, rz: float) -> np.ndarray:
+    """Build the combined rotation matrix Rz @ Ry @ Rx (X-axis rotation applied first)."""
+    cx, sx = math.cos(rx), math.sin(rx)
+    cy, sy = math.cos(ry), math.sin(ry)
+    cz, sz = math.cos(rz), math.sin(rz)
+    
+    R = np.empty((3, 3))
+    R[0, 0], R[0, 1], R[0, 2] = cy * cz, sx * sy * cz - cx * sz, cx * sy * cz + sx * sz
+    R[1, 0], R[1, 1], R[1, 2] = cy * sz, sx * sy * sz + cx * cz, cx * sy * sz - sx * cz
+    R[2, 0], R[2, 1], R[2, 2] = -sy, sx * cy, cx * cy
+    return R
+
+@njit(cache=True, fastmath=True)
+def transform_project(V: np.ndarray, R: np.ndarray, S: np.ndarray, T: np.ndarray,
+                      cam_z: float, fov: float, out: np.ndarray) -> None:
+    """Scale, rotate and translate vertices, then project them into out as (x, y, camera_z)."""
+    for i in range(V.shape[0]):
+        x, y, z = V[i, 0] * S[0], V[i, 1] * S[1], V[i, 2] * S[2]
+        wx = R[0, 0] * x + R[0, 1] * y + R[0, 2] * z + T[0]
+        wy = R[1, 0] * x + R[1, 1] * y + R[1, 2] * z + T[1]
+        wz = R[2, 0] * x + R[2, 1] * y + R[2, 2] * z + T[2]
+        
+        camera_z = wz - cam_z
+        if camera_z <= 0:
+            # Point is behind camera
+            out[i, 0], out[i, 1], out[i, 2] = 0.0, 0.0, 0.0
+            continue
+        scale = fov / camera_z
+        out[i, 0], out[i, 1], out[i, 2] = wx * scale, wy * scale, camera_z
+
+@njit(cache=True, fastmath=True)
+def update_stars(z: np.ndarray, speed: np.ndarray, hue: np.ndarray, hue_speed: np.ndarray,
+                 flicker: np.ndarray, flicker_state: np.ndarray, flicker_speed: np.ndarray,
+                 movement: float) -> None:
+    """Advance star depth, hue and flicker state in place."""
+    for i in range(z.shape[0]):
+        z[i] -= movement * speed[i]
+        hue[i] = (hue[i] + hue_speed[i]) % 1.0
+        if flicker[i]:
+            flicker_state[i] = (flicker_state[i] + flicker_speed[i]) % (2 * math.pi)
+
+# Code generation for transforms specialized to a fixed set of vertices
+@lru_cache(maxsize=None)
+def generate_cube_transform(signs: Tuple[Tuple[int, int, int], ...],
+                            size: float) -> Callable[..., None]:
+    """Generate transform_project specialized to vertices (sx*size, sy*size, sz*size).
+    
+    Every vertex is a signed sum of the three rotated, scaled basis vectors, so the
+    generated code computes those once, shares the sums of the first two between
+    vertices and unrolls the per-vertex work. The vertices are baked in, so the
+    generated function takes the kernel's arguments without V.
+    """
+    lines = [
+        "def transform_cube(R, S, T, cam_z, fov, out):",
+        # Rotated basis vectors, scaled by the object scale and the cube size
+        f"    ux, uy, uz = R[0, 0] * S[0] * {size!r}, R[1, 0] * S[0] * {size!r}, R[2, 0] * S[0] * {size!r}",
+        f"    vx, vy, vz = R[0, 1] * S[1] * {size!r}, R[1, 1] * S[1] * {size!r}, R[2, 1] * S[1] * {size!r}",
+        f"    wx, wy, wz = R[0, 2] * S[2] * {size!r}, R[1, 2] * S[2] * {size!r}, R[2, 2] * S[2] * {size!r}",
+        "    px, py, pz = ux + vx, uy + vy, uz + vz",
+        "    mx, my, mz = ux - vx, uy - vy, uz - vz",
+        "    tx, ty, tz = T[0], T[1], T[2]",
+    ]
+    for i, (a, b, c) in enumerate(signs):
+        # (a*u + b*v) is ±(u + v) or ±(u - v); the sign is a's
+        uv = "p" if a == b else "m"
+        uv_sign = "+" if a > 0 else "-"
+        w_sign = "+" if c > 0 else "-"
+        lines += [
+            f"    x = tx {uv_sign} {uv}x {w_sign} wx",
+            f"    y = ty {uv_sign} {uv}y {w_sign} wy",
+            f"    camera_z = tz {uv_sign} {uv}z {w_sign} wz - cam_z",
+            "    if camera_z > 0:",
+            "        scale = fov / camera_z",
+            f"        out[{i}, 0], out[{i}, 1], out[{i}, 2] = x * scale, y * scale, camera_z",
+            "    else:",
+            f"        out[{i}, 0], out[{i}, 1], out[{i}, 2] = 0.0, 0.0, 0.0",
+        ]
+    
+    namespace = {}
+    exec(compile("\n".join(lines), "<transform_cube>", "exec"), namespace)
+    return namespace["transform_cube"]
+
 # Camera for view control
 class Camera:
     def __init__(self):
-        self.position = Vector3D(0, 0, -500)
+        self.position = Vec3(0, 0, -500)
         self.fov = Config.SCREEN_WIDTH * 0.8
     
     def move(self, delta: Vector3D) -> None:
         """Move camera by delta amount."""
-        self.position = self.position + delta
+        position = self.position
+        self.position = Vec3(position.x + delta.x, position.y + delta.y, position.z + delta.z)
     
-    def project_point(self, point: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Project 3D point to 2D screen space."""
-        x, y, z = point
-        
-        # Apply perspective projection
-        camera_z = z - self.position.z
-        if camera_z <= 0:
-            # Point is behind camera
-            return (0, 0, 0)
-            
-        scale = self.fov / camera_z
-        screen_x = x * scale
-        screen_y = y * scale
-        
-        return (screen_x, screen_y, camera_z)
+    def project(self, x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+                ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Project 3D points to 2D screen space, returning screen x, y and camera depth.
+        
+        The results are written into the three arrays of out when it is given.
+        """
+        if out is None:
+            out = (np.empty_like(x), np.empty_like(y), np.empty_like(z))
+        screen_x, screen_y, camera_z = out
+        
+        # Apply perspective projection; points behind the camera collapse to the origin
+        np.subtract(z, self.position.z, out=camera_z)
+        scale = screen_x  # Built in place, then replaced by the screen x coordinates
+        np.maximum(camera_z, 1e-6, out=scale)
+        np.divide(self.fov, scale, out=scale)
+        np.copyto(scale, 0.0, where=camera_z <= 0)
+        np.multiply(y, scale, out=screen_y)
+        np.multiply(x, scale, out=screen_x)
+        return out
 
-# Advanced star particle
-class StarParticle:
-    def __init__(self):
-        self.position = Vector3D()
-        self.reset()
-        self.hue = random.random()
-        
-    def reset(self) -> None:
-        """Reset star to a new random position."""
-        self.position.z = random.randint(10, Config.SCREEN_WIDTH)
-        self.position.x = random.randint(-Config.SCREEN_WIDTH//2, Config.SCREEN_WIDTH//2)
-        self.position.y = random.randint(-Config.SCREEN_HEIGHT//2, Config.SCREEN_HEIGHT//2)
-        self.speed = random.uniform(0.5, 2.0)
-        self.size = random.uniform(1, 3)
-        self.hue_speed = random.uniform(0.002, 0.005)
-        self.trail_length = random.randint(1, 5) if random.random() > 0.7 else 0
-        self.flicker = random.random() > 0.9  # Some stars flicker
-        self.flicker_speed = random.uniform(0.05, 0.2)
-        self.flicker_state = 0
+# Star field stored as parallel arrays (one entry per star)
+class StarField:
+    def __init__(self, count: int):
+        self.rng = np.random.default_rng()
+        self.x = np.zeros(count)
+        self.y = np.zeros(count)
+        self.z = np.zeros(count)
+        self.speed = np.zeros(count)
+        self.size = np.zeros(count)
+        self.hue_speed = np.zeros(count)
+        self.trail_length = np.zeros(count, dtype=np.int32)
+        self.flicker = np.zeros(count, dtype=bool)
+        self.flicker_speed = np.zeros(count)
+        self.flicker_state = np.zeros(count)
+        self.reset_mask(np.ones(count, dtype=bool))
+        self.hue = self.rng.random(count)
+        
+        # Per-frame results of get_screen_positions, reused across frames
+        self._screen_x = np.empty(count)
+        self._screen_y = np.empty(count)
+        self._camera_z = np.empty(count)
+        self._screen_size = np.empty(count)
+        self._flicker_factor = np.empty(count)
+        self._in_front = np.empty(count, dtype=bool)
+        
+    def reset_mask(self, mask: np.ndarray) -> None:
+        """Reset the masked stars to new random positions."""
+        n = int(mask.sum())
+        if n == 0:
+            return
+        rng = self.rng
+        self.z[mask] = rng.integers(10, Config.SCREEN_WIDTH, n, endpoint=True)
+        self.x[mask] = rng.integers(-Config.SCREEN_WIDTH//2, Config.SCREEN_WIDTH//2, n, endpoint=True)
+        self.y[mask] = rng.integers(-Config.SCREEN_HEIGHT//2, Config.SCREEN_HEIGHT//2, n, endpoint=True)
+        self.speed[mask] = rng.uniform(0.5, 2.0, n)
+        self.size[mask] = rng.uniform(1, 3, n)
+        self.hue_speed[mask] = rng.uniform(0.002, 0.005, n)
+        self.trail_length[mask] = np.where(rng.random(n) > 0.7,
+                                           rng.integers(1, 5, n, endpoint=True), 0)
+        self.flicker[mask] = rng.random(n) > 0.9  # Some stars flicker
+        self.flicker_speed[mask] = rng.uniform(0.05, 0.2, n)
+        self.flicker_state[mask] = 0
         
     def update(self, delta_time: float) -> None:
-        """Update star position and properties."""
+        """Update all star positions and properties."""
         # Scale movement by delta_time for frame-rate independence
-        movement = Config.STAR_SPEED * self.speed * delta_time * 60
-        self.position.z -= movement
-        self.hue = (self.hue + self.hue_speed) % 1.0
+        movement = Config.STAR_SPEED * delta_time * 60
+        update_stars(self.z, self.speed, self.hue, self.hue_speed,
+                     self.flicker, self.flicker_state, self.flicker_speed, movement)
+        self.reset_mask(self.z < 1)
         
-        # Update flicker effect
-        if self.flicker:
-            self.flicker_state = (self.flicker_state + self.flicker_speed) % (2 * math.pi)
+    def get_screen_positions(
+            self, camera: Camera) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return screen x, y, size and an in-front-of-camera mask for all stars.
         
-        if self.position.z < 1:
-            self.reset()
-            
-    def get_screen_position(self, camera: Camera) -> Tuple[float, float, float]:
-        """Convert 3D position to 2D screen position with perspective."""
-        x, y, z = camera.project_point((self.position.x, self.position.y, self.position.z))
+        The returned arrays are reused and overwritten by the next call.
+        """
+        sx, sy, cz = camera.project(self.x, self.y, self.z,
+                                    out=(self._screen_x, self._screen_y, self._camera_z))
         
         # Calculate star size based on distance
-        size = self.size * (1 - self.position.z/Config.SCREEN_WIDTH)
-        
-        # Apply flicker effect if enabled
-        if self.flicker:
-            flicker_factor = 0.5 + 0.5 * math.sin(self.flicker_state)
-            size *= flicker_factor
-        
-        return x, y, size
+        size = self._screen_size
+        np.divide(self.z, -Config.SCREEN_WIDTH, out=size)
+        size += 1
+        size *= self.size
+        
+        # Apply flicker effect where enabled
+        factor = self._flicker_factor
+        np.sin(self.flicker_state, out=factor)
+        factor *= 0.5
+        factor += 0.5
+        np.multiply(size, factor, out=size, where=self.flicker)
+        
+        return sx, sy, size, np.greater(cz, 0, out=self._in_front)
 
 # Base 3D object class
 class Object3D:
+    # Hue offsets between neighbouring faces/edges, in _LUT entries
+    FACE_STEP = int(0.05 * 1024)
+    EDGE_STEP = int(0.02 * 1024)
+    
     def __init__(self):
-        self.position = Vector3D()
-        self.rotation = Vector3D()
-        self.scale = Vector3D(1, 1, 1)
-        self.vertices: List[Tuple[float, float, float]] = []
-        self.edges: List[Tuple[int, int]] = []
-        self.faces: List[List[int]] = []
+        self.position = Vec3()
+        self.rotation = Vector3D()  # Mutated in place by rotate()
+        self.scale = Vec3(1, 1, 1)
+        self.vertices = np.zeros((0, 3))
+        self.edges = np.zeros((0, 2), dtype=np.int32)  # Vertex index pairs
+        self.faces = np.zeros((0, 4), dtype=np.int32)  # Vertex indices of each polygon
         self.hue_shift = 0.0
+        self._R = np.eye(3)  # Rotation matrix for the current rotation angles
+        
+        # Per-frame inputs and results of the transform, reused across frames
+        self._scale = np.ones(3)
+        self._translation = np.zeros(3)
+        self._projected = np.empty((0, 3))
     
     def rotate(self, delta_time: float, speed_multiplier: float = 1.0) -> None:
         """Rotate the object based on current rotation speeds."""
@@ -157,129 +317,55 @@ class Object3D:
         self.rotation.y += rotation_speed * 0.7
         self.rotation.z += rotation_speed * 0.3
         self.hue_shift = (self.hue_shift + Config.HUE_SPEED * delta_time * 60) % 1.0
+        self._R = build_rotation_matrix(self.rotation.x, self.rotation.y, self.rotation.z)
     
-    def transform_vertex(self, vertex: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Apply rotation transformation to a vertex."""
-        x, y, z = vertex
-        
-        # Apply scale
-        x *= self.scale.x
-        y *= self.scale.y
-        z *= self.scale.z
-        
-        # Rotate around X-axis
-        y, z = (y * math.cos(self.rotation.x) - z * math.sin(self.rotation.x),
-                y * math.sin(self.rotation.x) + z * math.cos(self.rotation.x))
-        
-        # Rotate around Y-axis
-        x, z = (x * math.cos(self.rotation.y) + z * math.sin(self.rotation.y),
-                -x * math.sin(self.rotation.y) + z * math.cos(self.rotation.y))
-        
-        # Rotate around Z-axis
-        x, y = (x * math.cos(self.rotation.z) - y * math.sin(self.rotation.z),
-                x * math.sin(self.rotation.z) + y * math.cos(self.rotation.z))
-        
-        # Apply translation
-        x += self.position.x
-        y += self.position.y
-        z += self.position.z
-        
-        return (x, y, z)
+    def _project_vertices(self, S: np.ndarray, T: np.ndarray, cam_z: float, fov: float,
+                          out: np.ndarray) -> None:
+        """Transform and project all vertices into out as (x, y, camera_z)."""
+        transform_project(self.vertices, self._R, S, T, cam_z, fov, out)
     
-    def calculate_face_normal(self, face: List[int], 
-                              projected_vertices: List[Tuple[float, float, float]]) -> Vector3D:
-        """Calculate normal vector for a face."""
-        if len(face) < 3:
-            return Vector3D(0, 0, 1)
-            
-        # Get three points from the face
-        v0 = Vector3D(*projected_vertices[face[0]])
-        v1 = Vector3D(*projected_vertices[face[1]])
-        v2 = Vector3D(*projected_vertices[face[2]])
-        
-        # Calculate two edges
-        edge1 = v1 - v0
-        edge2 = v2 - v0
-        
-        # Cross product to get normal
-        normal = edge1.cross(edge2)
-        
-        return normal.normalize()
-    
-    def should_render_face(self, face: List[int], 
-                           projected_vertices: List[Tuple[float, float, float]]) -> bool:
-        """Determine if a face should be rendered (backface culling)."""
-        normal = self.calculate_face_normal(face, projected_vertices)
-        
-        # Camera is assumed to be looking at -Z direction
-        view_vector = Vector3D(0, 0, 1)
-        
-        # If dot product is negative, face is facing the camera
-        return normal.dot(view_vector) < 0
-    
-    def draw(self, turtle_obj: turtle.Turtle, camera: Camera, wireframe: bool = True) -> None:
-        """Draw the 3D object using the provided turtle object."""
+    def draw(self, backend: 'Backend', camera: Camera, wireframe: bool = True) -> None:
+        """Draw the 3D object with the given rendering backend."""
         # Transform and project all vertices
-        projected_vertices = []
-        for vertex in self.vertices:
-            transformed = self.transform_vertex(vertex)
-            projected = camera.project_point(transformed)
-            projected_vertices.append(projected)
+        scale, translation = self._scale, self._translation
+        scale[:] = self.scale
+        translation[:] = self.position
+        projected = self._projected
+        if len(projected) != len(self.vertices):
+            projected = self._projected = np.empty((len(self.vertices), 3))
+        self._project_vertices(scale, translation, camera.position.z, camera.fov, projected)
+        
+        # Colors are _LUT indices offset from the current hue
+        base = int(self.hue_shift * 1024) & 1023
         
         if not wireframe:
             # Draw faces (solid rendering)
-            # Sort faces by average Z for proper depth rendering
-            face_data = []
-            for i, face in enumerate(self.faces):
-                if not self.should_render_face(face, projected_vertices):
-                    continue
-                    
-                avg_z = sum(projected_vertices[v][2] for v in face) / len(face)
-                face_data.append((face, avg_z, i))
+            faces = self.faces
             
-            # Sort faces by Z depth (back to front)
-            face_data.sort(key=lambda x: x[1], reverse=True)
+            # Backface culling: faces whose normal points along -Z face the camera
+            v0 = projected[faces[:, 0]]
+            normals = np.cross(projected[faces[:, 1]] - v0, projected[faces[:, 2]] - v0)
+            visible = np.flatnonzero(normals[:, 2] < 0)
+            visible_faces = faces[visible]
             
-            # Draw each face
-            for face, _, face_idx in face_data:
-                # Create color based on face index and hue shift
-                hue = (self.hue_shift + face_idx * 0.05) % 1.0
-                color = ColorUtils.hsv_to_rgb(hue)
-                turtle_obj.color(color)
-                
-                # Draw the face as a filled polygon
-                turtle_obj.penup()
-                first_vertex = face[0]
-                x, y, _ = projected_vertices[first_vertex]
-                turtle_obj.goto(x, y)
-                turtle_obj.pendown()
-                turtle_obj.begin_fill()
-                
-                for vertex_idx in face[1:] + [first_vertex]:
-                    x, y, _ = projected_vertices[vertex_idx]
-                    turtle_obj.goto(x, y)
-                
-                turtle_obj.end_fill()
+            # Sort faces by average Z depth (back to front)
+            avg_z = projected[visible_faces, 2].mean(axis=1)
+            order = np.argsort(-avg_z, kind='stable')
+            
+            # Color based on face index and hue shift
+            colors = (base + visible[order] * self.FACE_STEP) & 1023
+            backend.draw_faces(projected[visible_faces[order], :2], colors)
         else:
             # Draw edges with dynamic colors
-            for i, edge in enumerate(self.edges):
-                # Create color gradient along the edges
-                hue = (self.hue_shift + i * 0.02) % 1.0
-                color = ColorUtils.hsv_to_rgb(hue)
-                
-                turtle_obj.color(color)
-                v1, v2 = edge
-                x1, y1, z1 = projected_vertices[v1]
-                x2, y2, z2 = projected_vertices[v2]
-                
-                # Skip edges with negative z (behind camera)
-                if z1 <= 0 or z2 <= 0:
-                    continue
-                
-                turtle_obj.penup()
-                turtle_obj.goto(x1, y1)
-                turtle_obj.pendown()
-                turtle_obj.goto(x2, y2)
+            edges = self.edges
+            
+            # Skip edges with an endpoint behind the camera
+            edge_visible = (projected[edges[:, 0], 2] > 0) & (projected[edges[:, 1], 2] > 0)
+            indices = np.flatnonzero(edge_visible)
+            
+            # Color gradient along the edges
+            colors = (base + indices * self.EDGE_STEP) & 1023
+            backend.draw_edges(projected[edges[indices], :2].reshape(-1, 4), colors)
 
 # Chromatic cube implementation
 class ChromaticCube(Object3D):
@@ -288,7 +374,7 @@ class ChromaticCube(Object3D):
         self.size = size
         
         # Define cube vertices
-        self.vertices = [
+        self.vertices = np.asarray([
             (-size, -size, -size),  # 0: back bottom left
             (size, -size, -size),   # 1: back bottom right
             (size, size, -size),    # 2: back top right
@@ -297,27 +383,45 @@ class ChromaticCube(Object3D):
             (size, -size, size),    # 5: front bottom right
             (size, size, size),     # 6: front top right
             (-size, size, size)     # 7: front top left
-        ]
+        ], dtype=np.float64)
+        
+        # Unrolled transform for these exact vertices. It only pays off without Numba;
+        # the compiled general kernel is as fast, and the vertices are frozen so they
+        # cannot change behind the generated code's back.
+        self.vertices.flags.writeable = False
+        self._baked_vertices = self.vertices
+        self._transform_cube = None
+        if not NUMBA_AVAILABLE:
+            signs = tuple(tuple(row) for row in np.sign(self.vertices).astype(int).tolist())
+            self._transform_cube = generate_cube_transform(signs, float(size))
         
         # Define cube edges
-        self.edges = [
+        self.edges = np.asarray([
             (0, 1), (1, 2), (2, 3), (3, 0),  # back face
             (4, 5), (5, 6), (6, 7), (7, 4),  # front face
             (0, 4), (1, 5), (2, 6), (3, 7)   # connecting edges
-        ]
+        ], dtype=np.int32)
         
         # Define cube faces
-        self.faces = [
+        self.faces = np.asarray([
             [0, 1, 2, 3],  # back
             [4, 5, 6, 7],  # front
             [0, 1, 5, 4],  # bottom
             [2, 3, 7, 6],  # top
             [0, 3, 7, 4],  # left
             [1, 2, 6, 5]   # right
-        ]
+        ], dtype=np.int32)
+    
+    def _project_vertices(self, S: np.ndarray, T: np.ndarray, cam_z: float, fov: float,
+                          out: np.ndarray) -> None:
+        """Transform and project all vertices, using the unrolled transform when it applies."""
+        if self._transform_cube is not None and self.vertices is self._baked_vertices:
+            self._transform_cube(self._R, S, T, cam_z, fov, out)
+        else:
+            super()._project_vertices(S, T, cam_z, fov, out)
 
-# Animation manager class
-class AnimationManager:
+# Rendering backend drawing on the turtle screen
+class TurtleBackend:
     def __init__(self):
         # Initialize screen
         self.screen = turtle.Screen()
@@ -336,36 +440,283 @@ class AnimationManager:
             t.speed(0)
         
         self.cube_turtle.pensize(2)
+    
+    def bind_keys(self, bindings: Dict[str, Callable[[], None]]) -> None:
+        """Call each handler when its key (a Tk key name) is pressed."""
+        for key, handler in bindings.items():
+            self.screen.onkeypress(handler, key)
+        self.screen.listen()
+    
+    def begin_frame(self) -> None:
+        """Clear the previous frame's stars and cube."""
+        self.star_turtle.clear()
+        self.cube_turtle.clear()
+    
+    def draw_stars(self, xs: np.ndarray, ys: np.ndarray, sizes: np.ndarray, colors: np.ndarray,
+                   trail_xs: np.ndarray, trail_ys: np.ndarray, trails: np.ndarray) -> None:
+        """Draw stars as dots, with a trail line to (trail_x, trail_y) where enabled."""
+        # Bind turtle methods once instead of looking them up per star
+        st = self.star_turtle
+        goto, dot, penup, pendown, setcolor, pensize = (
+            st.goto, st.dot, st.penup, st.pendown, st.color, st.pensize)
+        lut = _LUT
+        
+        for x, y, size, color, trail_x, trail_y, trail in zip(
+                xs.tolist(), ys.tolist(), sizes.tolist(), colors.tolist(),
+                trail_xs.tolist(), trail_ys.tolist(), trails.tolist()):
+            setcolor(lut[color])
+            
+            # Draw star
+            penup()
+            goto(x, y)
+            dot(size)
+            
+            # Draw trail if enabled
+            if trail:
+                pensize(size * 0.7)
+                pendown()
+                goto(trail_x, trail_y)
+    
+    def draw_faces(self, polygons: np.ndarray, colors: np.ndarray) -> None:
+        """Draw filled polygons given as (N, vertices, 2) screen points, in order."""
+        # Bind turtle methods once instead of looking them up per primitive
+        t = self.cube_turtle
+        t_color, t_goto, t_penup, t_pendown = t.color, t.goto, t.penup, t.pendown
+        lut = _LUT
+        
+        for polygon, color in zip(polygons.tolist(), colors.tolist()):
+            t_color(lut[color])
+            
+            # Draw the face as a filled polygon
+            t_penup()
+            x, y = polygon[0]
+            t_goto(x, y)
+            t_pendown()
+            t.begin_fill()
+            
+            for x, y in polygon[1:] + polygon[:1]:
+                t_goto(x, y)
+            
+            t.end_fill()
+    
+    def draw_edges(self, segments: np.ndarray, colors: np.ndarray) -> None:
+        """Draw lines given as (N, 4) rows of x1, y1, x2, y2."""
+        t = self.cube_turtle
+        t_color, t_goto, t_penup, t_pendown = t.color, t.goto, t.penup, t.pendown
+        lut = _LUT
+        
+        for (x1, y1, x2, y2), color in zip(segments.tolist(), colors.tolist()):
+            t_color(lut[color])
+            t_penup()
+            t_goto(x1, y1)
+            t_pendown()
+            t_goto(x2, y2)
+    
+    def draw_status(self, text: str) -> None:
+        """Show text in the top-left corner."""
+        self.text_turtle.clear()
+        self.text_turtle.penup()
+        self.text_turtle.goto(-Config.SCREEN_WIDTH/2 + 10, Config.SCREEN_HEIGHT/2 - 30)
+        self.text_turtle.color("white")
+        self.text_turtle.write(text, font=("Arial", 12, "normal"))
+    
+    def present(self) -> None:
+        """Show everything drawn so far."""
+        self.screen.update()
+    
+    def schedule(self, callback: Callable[[], None], delay_ms: int) -> None:
+        """Call callback once after delay_ms milliseconds."""
+        self.screen.ontimer(callback, delay_ms)
+    
+    def mainloop(self) -> None:
+        """Run the Tk event loop until the window is closed."""
+        self.screen.mainloop()
+    
+    def close(self) -> None:
+        """Close the window."""
+        self.screen.bye()
+
+# Rendering backend drawing with pygame (SDL), redrawing the whole frame each time
+class PygameBackend:
+    KEY_NAMES = {"space": "space", "Up": "up", "Down": "down", "Escape": "escape"}
+    
+    def __init__(self, on_close):
+        pygame.init()
+        self.surface = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+        pygame.display.set_caption("3D Space Animation")
+        pygame.key.set_repeat(300, 50)  # Held keys repeat like Tk key presses
+        self.on_close = on_close
+        self.closed = False
+        self.in_mainloop = False
+        self.pending = None  # (callback, delay_ms) of the next scheduled call
+        self.key_handlers: Dict[int, Callable[[], None]] = {}
+        
+        # pygame colors for each _LUT entry
+        self.colors = [tuple(int(c * 255) for c in rgb) for rgb in _LUT]
+        self.background = (0, 0, 0)
+        
+        # Status text, rendered once per change
+        self.font = pygame.font.SysFont("Arial", 16)
+        self.status_images = []
+        self.status_rects = []
+        self.frame_begun = False
+        
+        # Screen coordinates have their origin at the top-left corner
+        self.center_x = Config.SCREEN_WIDTH // 2
+        self.center_y = Config.SCREEN_HEIGHT // 2
+    
+    def bind_keys(self, bindings: Dict[str, Callable[[], None]]) -> None:
+        """Call each handler when its key (a Tk key name) is pressed."""
+        for key, handler in bindings.items():
+            code = pygame.key.key_code(self.KEY_NAMES.get(key, key))
+            self.key_handlers[code] = handler
+    
+    def begin_frame(self) -> None:
+        """Start a new frame by clearing the window."""
+        self.surface.fill(self.background)
+        self.frame_begun = True
+    
+    def draw_stars(self, xs: np.ndarray, ys: np.ndarray, sizes: np.ndarray, colors: np.ndarray,
+                   trail_xs: np.ndarray, trail_ys: np.ndarray, trails: np.ndarray) -> None:
+        """Draw stars as dots, with a trail line to (trail_x, trail_y) where enabled."""
+        circle, line, surface = pygame.draw.circle, pygame.draw.line, self.surface
+        rgb = self.colors
+        cx, cy = self.center_x, self.center_y
+        
+        # Screen-space geometry for every dot and trail, computed in bulk
+        screen_xs, screen_ys = cx + xs, cy - ys
+        radii = np.maximum(1.0, sizes / 2)
+        widths = np.maximum(1, (sizes * 0.7).astype(np.int32))
+        
+        for x, y, radius, color, trail_x, trail_y, width, trail in zip(
+                screen_xs.tolist(), screen_ys.tolist(), radii.tolist(), colors.tolist(),
+                (cx + trail_xs).tolist(), (cy - trail_ys).tolist(), widths.tolist(),
+                trails.tolist()):
+            circle(surface, rgb[color], (x, y), radius)
+            if trail:
+                line(surface, rgb[color], (x, y), (trail_x, trail_y), width)
+    
+    def draw_faces(self, polygons: np.ndarray, colors: np.ndarray) -> None:
+        """Draw filled polygons given as (N, vertices, 2) screen points, in order."""
+        polygon, surface = pygame.draw.polygon, self.surface
+        rgb = self.colors
+        cx, cy = self.center_x, self.center_y
+        
+        for points, color in zip(polygons.tolist(), colors.tolist()):
+            polygon(surface, rgb[color], [(cx + x, cy - y) for x, y in points])
+    
+    def draw_edges(self, segments: np.ndarray, colors: np.ndarray) -> None:
+        """Draw lines given as (N, 4) rows of x1, y1, x2, y2."""
+        line, surface = pygame.draw.line, self.surface
+        rgb = self.colors
+        cx, cy = self.center_x, self.center_y
+        
+        for (x1, y1, x2, y2), color in zip(segments.tolist(), colors.tolist()):
+            line(surface, rgb[color], (cx + x1, cy - y1), (cx + x2, cy - y2), 2)
+    
+    def draw_status(self, text: str) -> None:
+        """Show text in the top-left corner."""
+        self.status_images = [self.font.render(line, True, (255, 255, 255))
+                              for line in text.split("\n")]
+    
+    def present(self) -> None:
+        """Draw the status text and show the finished frame."""
+        surface = self.surface
+        if not self.frame_begun:
+            # The old frame was kept, so erase the old text before writing the new one
+            for rect in self.status_rects:
+                surface.fill(self.background, rect)
+        
+        y = 10
+        self.status_rects = []
+        for image in self.status_images:
+            self.status_rects.append(surface.blit(image, (10, y)))
+            y += image.get_height()
+        
+        self.frame_begun = False
+        pygame.display.flip()
+    
+    def schedule(self, callback: Callable[[], None], delay_ms: int) -> None:
+        """Call callback once after delay_ms milliseconds."""
+        if self.closed:
+            return
+        self.pending = (callback, delay_ms)
+    
+    def mainloop(self) -> None:
+        """Run scheduled callbacks and dispatch window events until closed."""
+        self.in_mainloop = True
+        try:
+            while self.pending is not None and not self.closed:
+                callback, delay_ms = self.pending
+                self.pending = None
+                pygame.time.wait(delay_ms)
+                
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.on_close()
+                    elif event.type == pygame.KEYDOWN and event.key in self.key_handlers:
+                        self.key_handlers[event.key]()
+                    if self.closed:
+                        return
+                callback()
+        finally:
+            self.in_mainloop = False
+            pygame.quit()
+    
+    def close(self) -> None:
+        """Close the window and leave the event loop."""
+        if not self.closed:
+            self.closed = True
+            self.pending = None
+            # Inside the loop a callback may still be drawing; the loop quits pygame on exit
+            if not self.in_mainloop:
+                pygame.quit()
+
+# Either rendering backend; both provide the same drawing and scheduling methods
+Backend = Union[TurtleBackend, PygameBackend]
+
+# Animation manager class
+class AnimationManager:
+    def __init__(self):
+        # Initialize rendering backend
+        if Config.USE_PYGAME and pygame is not None:
+            self.backend = PygameBackend(self.exit_animation)
+        else:
+            self.backend = TurtleBackend()
         
         # Create camera
         self.camera = Camera()
         
         # Create scene objects
         self.cube = ChromaticCube(Config.CUBE_SIZE)
-        self.stars = [StarParticle() for _ in range(Config.STAR_COUNT)]
+        self.stars = StarField(Config.STAR_COUNT)
+        self._star_visible = np.empty(Config.STAR_COUNT, dtype=bool)
         
         # Animation state
         self.running = True
         self.wireframe_mode = True
         self.rotation_speed = 1.0
-        self.last_frame_time = time.time()
+        self.last_frame_time = time.perf_counter()
         self.frame_count = 0
-        self.last_fps_update = time.time()
+        self.last_fps_update = time.perf_counter()
         self.current_fps = 0
+        self._dirty = True  # Scene changed since the last render
+        self._last_status_state = None  # Values shown by the status text
         
         # Setup key bindings
         self.setup_controls()
         
     def setup_controls(self) -> None:
         """Set up keyboard controls."""
-        self.screen.onkeypress(self.toggle_pause, "space")
-        self.screen.onkeypress(self.increase_speed, "Up")
-        self.screen.onkeypress(self.decrease_speed, "Down")
-        self.screen.onkeypress(self.toggle_wireframe, "w")
-        self.screen.onkeypress(lambda: self.move_camera(Vector3D(0, 0, 10)), "a")
-        self.screen.onkeypress(lambda: self.move_camera(Vector3D(0, 0, -10)), "z")
-        self.screen.onkeypress(self.exit_animation, "Escape")
-        self.screen.listen()
+        self.backend.bind_keys({
+            "space": self.toggle_pause,
+            "Up": self.increase_speed,
+            "Down": self.decrease_speed,
+            "w": self.toggle_wireframe,
+            "a": lambda: self.move_camera(Vector3D(0, 0, 10)),
+            "z": lambda: self.move_camera(Vector3D(0, 0, -10)),
+            "Escape": self.exit_animation,
+        })
     
     def toggle_pause(self) -> None:
         """Pause/resume the animation."""
@@ -375,69 +726,68 @@ class AnimationManager:
     def increase_speed(self) -> None:
         """Increase rotation speed."""
         self.rotation_speed = min(3.0, self.rotation_speed + 0.1)
+        self._dirty = True
         self.update_status()
     
     def decrease_speed(self) -> None:
         """Decrease rotation speed."""
         self.rotation_speed = max(0.1, self.rotation_speed - 0.1)
+        self._dirty = True
         self.update_status()
     
     def toggle_wireframe(self) -> None:
         """Toggle between wireframe and solid mode."""
         self.wireframe_mode = not self.wireframe_mode
+        self._dirty = True
         self.update_status()
     
     def move_camera(self, delta: Vector3D) -> None:
         """Move camera by delta amount."""
         self.camera.move(delta)
+        self._dirty = True
     
     def exit_animation(self) -> None:
         """Exit the animation."""
         self.running = False
-        self.screen.bye()
+        self.backend.close()
     
     def update_status(self) -> None:
-        """Update status text."""
-        self.text_turtle.clear()
-        self.text_turtle.penup()
-        self.text_turtle.goto(-Config.SCREEN_WIDTH/2 + 10, Config.SCREEN_HEIGHT/2 - 30)
-        self.text_turtle.color("white")
-        
+        """Update status text if anything it shows has changed."""
+        state = (self.wireframe_mode, round(self.rotation_speed, 1),
+                 round(self.current_fps, 1), self.running)
+        if state != self._last_status_state:
+            self._last_status_state = state
+            self._do_update_status()
+    
+    def _do_update_status(self) -> None:
+        """Redraw the status text."""
         status_text = f"Mode: {'Wireframe' if self.wireframe_mode else 'Solid'} | "
         status_text += f"Speed: {self.rotation_speed:.1f} | "
         status_text += f"FPS: {self.current_fps:.1f} | "
         status_text += f"Status: {'Running' if self.running else 'Paused'}"
         status_text += "\nControls: Space=Pause, Up/Down=Speed, W=Wireframe, A/Z=Zoom, Esc=Exit"
         
-        self.text_turtle.write(status_text, font=("Arial", 12, "normal"))
+        self.backend.draw_status(status_text)
     
     def draw_stars(self) -> None:
         """Draw all star particles."""
-        self.star_turtle.clear()
-        
-        for star in self.stars:
-            x, y, size = star.get_screen_position(self.camera)
-            if size <= 0:  # Skip stars with negative size
-                continue
-                
-            color = ColorUtils.hsv_to_rgb(star.hue)
-            self.star_turtle.color(color)
-            
-            # Draw star
-            self.star_turtle.penup()
-            self.star_turtle.goto(x, y)
-            self.star_turtle.dot(size)
-            
-            # Draw trail if enabled
-            if star.trail_length > 0:
-                self.star_turtle.pensize(size * 0.7)
-                self.star_turtle.pendown()
-                
-                # Calculate trail endpoint based on star's movement direction
-                trail_x = x + (x / 30) * star.trail_length
-                trail_y = y + (y / 30) * star.trail_length
-                
-                self.star_turtle.goto(trail_x, trail_y)
+        stars = self.stars
+        sx, sy, sizes, valid = stars.get_screen_positions(self.camera)
+        
+        # Skip stars behind the camera or with negative size
+        visible = np.greater(sizes, 0, out=self._star_visible)
+        visible &= valid
+        indices = np.flatnonzero(visible)
+        xs, ys = sx[indices], sy[indices]
+        colors = (stars.hue[indices] * 1024).astype(np.int32) & 1023
+        trail_lengths = stars.trail_length[indices]
+        
+        # Trail endpoints follow each star's movement direction
+        trail_xs = xs + (xs / 30) * trail_lengths
+        trail_ys = ys + (ys / 30) * trail_lengths
+        
+        self.backend.draw_stars(xs, ys, sizes[indices], colors,
+                                trail_xs, trail_ys, trail_lengths > 0)
     
     def calculate_fps(self, current_time: float) -> None:
         """Calculate and update FPS counter."""
@@ -449,6 +799,7 @@ class AnimationManager:
             self.current_fps = self.frame_count / elapsed
             self.frame_count = 0
             self.last_fps_update = current_time
+            self.update_status()
     
     def update(self, delta_time: float) -> None:
         """Update animation state."""
@@ -456,52 +807,57 @@ class AnimationManager:
             return
             
         # Update stars
-        for star in self.stars:
-            star.update(delta_time)
+        self.stars.update(delta_time)
             
         # Update cube
         self.cube.rotate(delta_time, self.rotation_speed)
+        self._dirty = True
     
     def render(self) -> None:
         """Render the current frame."""
-        self.cube_turtle.clear()
+        if not self.running and not self._dirty:
+            # Paused and nothing changed: keep the last frame on screen
+            self.backend.present()
+            return
+            
+        self.backend.begin_frame()
         
         # Draw stars first (background)
         self.draw_stars()
         
         # Draw cube
-        self.cube.draw(self.cube_turtle, self.camera, self.wireframe_mode)
+        self.cube.draw(self.backend, self.camera, self.wireframe_mode)
         
         # Update screen
-        self.screen.update()
+        self.backend.present()
+        self._dirty = False
+    
+    def _tick(self) -> None:
+        """Update and render one frame, then schedule the next one."""
+        current_time = time.perf_counter()
+        delta_time = current_time - self.last_frame_time
+        self.last_frame_time = current_time
+        
+        # Calculate FPS
+        self.calculate_fps(current_time)
+        
+        # Update state
+        self.update(delta_time)
+        
+        # Render frame
+        self.render()
+        
+        # Schedule the next frame, accounting for the time this one took
+        elapsed = time.perf_counter() - current_time
+        self.backend.schedule(self._tick, max(1, int((Config.FRAME_TIME - elapsed) * 1000)))
     
     def run(self) -> None:
         """Main animation loop."""
         self.update_status()
         
         try:
-            while True:
-                current_time = time.time()
-                delta_time = current_time - self.last_frame_time
-                self.last_frame_time = current_time
-                
-                # Calculate FPS
-                self.calculate_fps(current_time)
-                
-                # Update state
-                self.update(delta_time)
-                
-                # Render frame
-                self.render()
-                
-                # Update status every 30 frames
-                if self.frame_count % 30 == 0:
-                    self.update_status()
-                
-                # Calculate remaining time to maintain target frame rate
-                elapsed = time.time() - current_time
-                remaining = max(0, Config.FRAME_TIME - elapsed)
-                time.sleep(remaining)
+            self._tick()
+            self.backend.mainloop()
                 
         except (turtle.Terminator, KeyboardInterrupt):
             print("Animation terminated.")